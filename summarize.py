@@ -4,6 +4,8 @@
 
 import json
 import os
+import re
+import sqlite3
 import sys
 import urllib
 
@@ -73,6 +75,302 @@ CONTENTFUL_ENTITY_TYPES = {
     #'TEMPORAL:TIME',
 }
 
+# Closed-class words and common irregular forms used by the local analyzer
+# (word -> (lemma, partOfSpeech)); anything not listed falls back to suffix rules
+# (function adverbs such as "also" or "then" are tagged PART rather than ADV so
+# that they aren't counted as contentful)
+LOCAL_LEXICON = {
+    'a': ('a', 'DET'),
+    'an': ('an', 'DET'),
+    'the': ('the', 'DET'),
+    'this': ('this', 'DET'),
+    'that': ('that', 'DET'),
+    'these': ('this', 'DET'),
+    'those': ('that', 'DET'),
+    'some': ('some', 'DET'),
+    'any': ('any', 'DET'),
+    'every': ('every', 'DET'),
+    'each': ('each', 'DET'),
+    'no': ('no', 'DET'),
+    'all': ('all', 'DET'),
+    'both': ('both', 'DET'),
+    'either': ('either', 'DET'),
+    'neither': ('neither', 'DET'),
+    'few': ('few', 'DET'),
+    'many': ('many', 'DET'),
+    'much': ('much', 'DET'),
+    'several': ('several', 'DET'),
+    'such': ('such', 'DET'),
+    'other': ('other', 'DET'),
+    'another': ('another', 'DET'),
+    'own': ('own', 'DET'),
+    'same': ('same', 'DET'),
+    'i': ('I', 'PRON'),
+    'me': ('I', 'PRON'),
+    'my': ('my', 'PRON'),
+    'you': ('you', 'PRON'),
+    'your': ('your', 'PRON'),
+    'he': ('he', 'PRON'),
+    'him': ('he', 'PRON'),
+    'his': ('his', 'PRON'),
+    'she': ('she', 'PRON'),
+    'her': ('she', 'PRON'),
+    'it': ('it', 'PRON'),
+    'its': ('its', 'PRON'),
+    'we': ('we', 'PRON'),
+    'us': ('we', 'PRON'),
+    'our': ('our', 'PRON'),
+    'they': ('they', 'PRON'),
+    'them': ('they', 'PRON'),
+    'their': ('their', 'PRON'),
+    'mine': ('mine', 'PRON'),
+    'yours': ('yours', 'PRON'),
+    'hers': ('hers', 'PRON'),
+    'ours': ('ours', 'PRON'),
+    'theirs': ('theirs', 'PRON'),
+    'myself': ('myself', 'PRON'),
+    'yourself': ('yourself', 'PRON'),
+    'yourselves': ('yourselves', 'PRON'),
+    'himself': ('himself', 'PRON'),
+    'herself': ('herself', 'PRON'),
+    'itself': ('itself', 'PRON'),
+    'ourselves': ('ourselves', 'PRON'),
+    'themselves': ('themselves', 'PRON'),
+    'whose': ('whose', 'PRON'),
+    'something': ('something', 'PRON'),
+    'anything': ('anything', 'PRON'),
+    'nothing': ('nothing', 'PRON'),
+    'everything': ('everything', 'PRON'),
+    'someone': ('someone', 'PRON'),
+    'anyone': ('anyone', 'PRON'),
+    'everyone': ('everyone', 'PRON'),
+    'somebody': ('somebody', 'PRON'),
+    'anybody': ('anybody', 'PRON'),
+    'everybody': ('everybody', 'PRON'),
+    'nobody': ('nobody', 'PRON'),
+    'none': ('none', 'PRON'),
+    'who': ('who', 'PRON'),
+    'whom': ('who', 'PRON'),
+    'which': ('which', 'PRON'),
+    'what': ('what', 'PRON'),
+    'there': ('there', 'PRON'),
+    'about': ('about', 'ADP'),
+    'after': ('after', 'ADP'),
+    'at': ('at', 'ADP'),
+    'before': ('before', 'ADP'),
+    'beyond': ('beyond', 'ADP'),
+    'by': ('by', 'ADP'),
+    'during': ('during', 'ADP'),
+    'for': ('for', 'ADP'),
+    'from': ('from', 'ADP'),
+    'in': ('in', 'ADP'),
+    'into': ('into', 'ADP'),
+    'of': ('of', 'ADP'),
+    'on': ('on', 'ADP'),
+    'over': ('over', 'ADP'),
+    'through': ('through', 'ADP'),
+    'to': ('to', 'PART'),
+    'under': ('under', 'ADP'),
+    'with': ('with', 'ADP'),
+    'without': ('without', 'ADP'),
+    'above': ('above', 'ADP'),
+    'across': ('across', 'ADP'),
+    'against': ('against', 'ADP'),
+    'along': ('along', 'ADP'),
+    'among': ('among', 'ADP'),
+    'around': ('around', 'ADP'),
+    'as': ('as', 'ADP'),
+    'behind': ('behind', 'ADP'),
+    'below': ('below', 'ADP'),
+    'between': ('between', 'ADP'),
+    'down': ('down', 'ADP'),
+    'like': ('like', 'ADP'),
+    'near': ('near', 'ADP'),
+    'off': ('off', 'ADP'),
+    'onto': ('onto', 'ADP'),
+    'out': ('out', 'ADP'),
+    'per': ('per', 'ADP'),
+    'toward': ('toward', 'ADP'),
+    'towards': ('towards', 'ADP'),
+    'until': ('until', 'ADP'),
+    'up': ('up', 'ADP'),
+    'upon': ('upon', 'ADP'),
+    'via': ('via', 'ADP'),
+    'within': ('within', 'ADP'),
+    'and': ('and', 'CONJ'),
+    'but': ('but', 'CONJ'),
+    'or': ('or', 'CONJ'),
+    'nor': ('nor', 'CONJ'),
+    'because': ('because', 'SCONJ'),
+    'if': ('if', 'SCONJ'),
+    'since': ('since', 'SCONJ'),
+    'than': ('than', 'SCONJ'),
+    'though': ('though', 'SCONJ'),
+    'although': ('although', 'SCONJ'),
+    'when': ('when', 'SCONJ'),
+    'while': ('while', 'SCONJ'),
+    'whether': ('whether', 'SCONJ'),
+    'unless': ('unless', 'SCONJ'),
+    'where': ('where', 'SCONJ'),
+    'whereas': ('whereas', 'SCONJ'),
+    'how': ('how', 'SCONJ'),
+    'why': ('why', 'SCONJ'),
+    'yet': ('yet', 'CONJ'),
+    'so': ('so', 'PART'),
+    'not': ('not', 'PART'),
+    "n't": ('not', 'PART'),
+    "'s": ("'s", 'PART'),
+    "'re": ('be', 'AUX'),
+    "'m": ('be', 'AUX'),
+    "'ve": ('have', 'AUX'),
+    "'ll": ('will', 'AUX'),
+    "'d": ('would', 'AUX'),
+    'am': ('be', 'AUX'),
+    'are': ('be', 'AUX'),
+    'be': ('be', 'AUX'),
+    'been': ('be', 'AUX'),
+    'being': ('be', 'AUX'),
+    'is': ('be', 'AUX'),
+    'was': ('be', 'AUX'),
+    'were': ('be', 'AUX'),
+    'can': ('can', 'AUX'),
+    'ca': ('can', 'AUX'),
+    'could': ('could', 'AUX'),
+    'may': ('may', 'AUX'),
+    'might': ('might', 'AUX'),
+    'must': ('must', 'AUX'),
+    'shall': ('shall', 'AUX'),
+    'should': ('should', 'AUX'),
+    'will': ('will', 'AUX'),
+    'wo': ('will', 'AUX'),
+    'would': ('would', 'AUX'),
+    'do': ('do', 'AUX'),
+    'does': ('do', 'AUX'),
+    'did': ('do', 'AUX'),
+    'have': ('have', 'AUX'),
+    'has': ('have', 'AUX'),
+    'had': ('have', 'AUX'),
+    'also': ('also', 'PART'),
+    'more': ('more', 'PART'),
+    'most': ('most', 'PART'),
+    'very': ('very', 'PART'),
+    'again': ('again', 'PART'),
+    'almost': ('almost', 'PART'),
+    'already': ('already', 'PART'),
+    'always': ('always', 'PART'),
+    'even': ('even', 'PART'),
+    'ever': ('ever', 'PART'),
+    'here': ('here', 'PART'),
+    'just': ('just', 'PART'),
+    'less': ('less', 'PART'),
+    'never': ('never', 'PART'),
+    'now': ('now', 'PART'),
+    'often': ('often', 'PART'),
+    'only': ('only', 'PART'),
+    'quite': ('quite', 'PART'),
+    'rather': ('rather', 'PART'),
+    'still': ('still', 'PART'),
+    'then': ('then', 'PART'),
+    'thus': ('thus', 'PART'),
+    'too': ('too', 'PART'),
+    'well': ('well', 'PART'),
+    'went': ('go', 'VERB'),
+    'gone': ('go', 'VERB'),
+    'made': ('make', 'VERB'),
+    'said': ('say', 'VERB'),
+    'told': ('tell', 'VERB'),
+    'took': ('take', 'VERB'),
+    'taken': ('take', 'VERB'),
+    'came': ('come', 'VERB'),
+    'saw': ('see', 'VERB'),
+    'seen': ('see', 'VERB'),
+    'found': ('find', 'VERB'),
+    'got': ('get', 'VERB'),
+    'gave': ('give', 'VERB'),
+    'given': ('give', 'VERB'),
+    'knew': ('know', 'VERB'),
+    'known': ('know', 'VERB'),
+    'thought': ('think', 'VERB'),
+    'began': ('begin', 'VERB'),
+    'led': ('lead', 'VERB'),
+    'men': ('man', 'NOUN'),
+    'women': ('woman', 'NOUN'),
+    'children': ('child', 'NOUN'),
+    'people': ('person', 'NOUN'),
+    'news': ('news', 'NOUN'),
+    'family': ('family', 'NOUN'),
+    'assembly': ('assembly', 'NOUN'),
+    'supply': ('supply', 'NOUN'),
+    'reply': ('reply', 'NOUN'),
+    'rally': ('rally', 'NOUN'),
+    'morning': ('morning', 'NOUN'),
+    'evening': ('evening', 'NOUN'),
+    'ceiling': ('ceiling', 'NOUN'),
+    'hundred': ('hundred', 'NUM'),
+    'daily': ('daily', 'ADJ'),
+    'early': ('early', 'ADJ'),
+    'likely': ('likely', 'ADJ'),
+    'friendly': ('friendly', 'ADJ'),
+    'lonely': ('lonely', 'ADJ'),
+    'ugly': ('ugly', 'ADJ'),
+    'holy': ('holy', 'ADJ'),
+    'apply': ('apply', 'VERB'),
+    'first': ('one', 'ADJ'),
+    'second': ('two', 'ADJ'),
+    'third': ('three', 'ADJ')
+}
+
+# Suffix rewrite rules applied (in order) to words missing from LOCAL_LEXICON
+# (suffix, replacement, partOfSpeech); rules that replace a suffix with itself
+# guard endings such as "-is" in "analysis" from the more general rules below
+# them, and stems left by "-ed"/"-ing" are restored by local_verb_stem
+LOCAL_SUFFIX_RULES = (
+    ('ly', 'ly', 'ADV'),
+    ('ies', 'y', 'NOUN'),
+    ('sses', 'ss', 'NOUN'),
+    ('ss', 'ss', 'NOUN'),
+    ('is', 'is', 'NOUN'),
+    ('ous', 'ous', 'ADJ'),
+    ('us', 'us', 'NOUN'),
+    ('s', '', 'NOUN'),
+    ('eed', 'eed', 'NOUN'),
+    ('ing', '', 'VERB'),
+    ('ied', 'y', 'VERB'),
+    ('ed', '', 'VERB'),
+)
+
+# Abbreviations that are usually followed by a capitalized name rather than
+# ending a sentence
+LOCAL_ABBREVIATIONS = (
+    'Mr', 'Mrs', 'Ms', 'Dr', 'Prof', 'Sr', 'Jr', 'St', 'Mt', 'Ft',
+    'Gen', 'Col', 'Maj', 'Capt', 'Lt', 'Sgt', 'Gov', 'Sen', 'Rep', 'Rev',
+    'Hon', 'Pres', 'Inc', 'Ltd', 'Co', 'Corp', 'Bros', 'vs'
+)
+
+# Sentences end at terminal punctuation (plus any closing quotes or brackets)
+# followed by whitespace and a word that is not lowercase (so that abbreviations
+# such as "U.S." mid-sentence are not boundaries), or at a blank line, but not
+# after any of LOCAL_ABBREVIATIONS
+LOCAL_SENTENCE_BOUNDARY = re.compile(
+    r'''(?<=[.!?])'''
+    + ''.join(r'(?<!\b{}\.)'.format(a) for a in LOCAL_ABBREVIATIONS)
+    + r'''['"\u2019\u201d)\]]*\s+(?![\sa-z])|\n\s*\n'''
+)
+
+# Words (with internal hyphens/apostrophes, abbreviations such as "U.S."),
+# clitics (split off as in "it 's" and "do n't", with straight or curly
+# apostrophes), numbers, and single punctuation characters
+LOCAL_TOKEN = re.compile(
+    r"(?:[^\W\d_]\.){2,}"
+    r"|n['\u2019]t\b"
+    r"|['\u2019](?:s|re|m|ve|ll|d)\b"
+    r"|\d+(?:[.,]\d+)*"
+    r"|\w+(?=n['\u2019]t\b)"
+    r"|\w+(?:-\w+|['\u2019](?!(?:s|re|m|ve|ll|d|t)\b)\w+)*"
+    r"|[^\w\s]",
+    re.IGNORECASE
+)
+
 def extent(obj):
     """Get the start and end offset attributes of a dict-like object
 
@@ -125,8 +423,10 @@ def entity_mentions(adm):
     """Generate named entity mentions from an ADM (Annotated Data Model)"""
     for entity in adm['attributes']['entities']['items']:
         for mention in entity['mentions']:
-            # Augment mentions with the entity type of the entity they refer to
+            # Augment mentions with the entity type and identifier of the entity
+            # they refer to
             mention['type'] = entity.get('type')
+            mention['entityId'] = entity.get('entityId')
             yield mention
 
 def request(content, endpoint, api, language=None, uri=False, **kwargs):
@@ -411,6 +711,171 @@ def get_adm(content, api, language=None, uri=False):
     adm['attributes']['token'].update(lemmas_adm['attributes']['token'])
     return adm
 
+def local_sentences(text):
+    """Split text into sentence objects with character offsets
+
+    local_sentences('Hi there. How are you?') -> [
+        {'startOffset': 0, 'endOffset': 10},
+        {'startOffset': 10, 'endOffset': 22}
+    ]
+
+    """
+    sentences = []
+    start = 0
+    for boundary in LOCAL_SENTENCE_BOUNDARY.finditer(text):
+        if text[start:boundary.start()].strip():
+            sentences.append({'startOffset': start, 'endOffset': boundary.end()})
+            start = boundary.end()
+    if text[start:].strip():
+        sentences.append({'startOffset': start, 'endOffset': len(text)})
+    return sentences
+
+def local_verb_stem(stem):
+    """Restore the base form of a verb stem left by stripping "-ed" or "-ing"
+
+    Doubled final consonants are undoubled and a final "e" is restored after
+    endings that don't occur without one in English and after short
+    consonant-vowel-consonant stems.  This is a heuristic, so some stems
+    (e.g., "creat" from "created") aren't restored.
+
+    local_verb_stem('stopp') -> 'stop'
+    local_verb_stem('us') -> 'use'
+    local_verb_stem('receiv') -> 'receive'
+    local_verb_stem('walk') -> 'walk'
+
+    """
+    vowels = 'aeiou'
+    if len(stem) > 2 and stem[-1] == stem[-2] and stem[-1] not in vowels + 'lsz':
+        return stem[:-1]
+    if stem.endswith(('v', 'c', 'iz', 'rg', 'dg')):
+        return stem + 'e'
+    if (
+        len(stem) <= 3
+        and stem[-1] not in vowels + 'wxy'
+        and stem[-2] in vowels
+        and (len(stem) == 2 or stem[-3] not in vowels)
+    ):
+        return stem + 'e'
+    return stem
+
+def local_analysis(word, sentence_initial=False, proper_nouns=frozenset()):
+    """Get a lemma/POS analysis of a word from the local lookup tables
+
+    Capitalized words are tagged PROPN unless they start a sentence, in which
+    case they are only tagged PROPN if they are in proper_nouns (e.g., because
+    the same form occurs capitalized elsewhere in the document).
+
+    local_analysis('was') -> {'lemma': 'be', 'partOfSpeech': 'AUX'}
+    local_analysis('rings') -> {'lemma': 'ring', 'partOfSpeech': 'NOUN'}
+    local_analysis('Saturn') -> {'lemma': 'Saturn', 'partOfSpeech': 'PROPN'}
+    local_analysis('Saturn', True) -> {'lemma': 'saturn', 'partOfSpeech': 'NOUN'}
+    local_analysis('Saturn', True, {'Saturn'}) -> {
+        'lemma': 'Saturn',
+        'partOfSpeech': 'PROPN'
+    }
+
+    """
+    lowered = word.lower().replace('\u2019', "'")
+    if lowered in LOCAL_LEXICON:
+        lemma, pos = LOCAL_LEXICON[lowered]
+    elif not any(c.isalnum() for c in word):
+        lemma, pos = word, 'PUNCT'
+    elif word[0].isdigit():
+        lemma, pos = word, 'NUM'
+    elif word[0].isupper() and (not sentence_initial or word in proper_nouns):
+        lemma, pos = word, 'PROPN'
+    else:
+        lemma, pos = lowered, 'NOUN'
+        for suffix, replacement, suffix_pos in LOCAL_SUFFIX_RULES:
+            if not lowered.endswith(suffix):
+                continue
+            stem = lowered[:-len(suffix)]
+            # short words and stems without a vowel (e.g., "str" from
+            # "string") aren't really suffixed
+            if (
+                len(lowered) > 3
+                and len(stem) > 1
+                and any(c in 'aeiouy' for c in stem)
+            ):
+                lemma = stem + replacement
+                if suffix_pos == 'VERB' and not replacement:
+                    lemma = local_verb_stem(lemma)
+                pos = suffix_pos
+                break
+            elif replacement == suffix:
+                # guarded endings aren't handed on to the more general rules
+                break
+    return {'lemma': lemma, 'partOfSpeech': pos}
+
+def get_local_adm(content, language=None, uri=False):
+    """Get an ADM from a local, rule-based analyzer without calling Rosette API
+
+    The ADM has the same shape as the result of get_adm (sentence, token, and
+    entities attributes) so it can be passed directly to summarize, but the
+    analyses are much coarser: sentences are split on terminal punctuation,
+    lemmas and parts of speech come from LOCAL_LEXICON and LOCAL_SUFFIX_RULES,
+    capitalized words are tagged PROPN (at the start of a sentence, only if
+    they also occur capitalized elsewhere in the document), and no named
+    entities are extracted.  This trades summary quality for avoiding the
+    network round-trips to Rosette API.
+
+    content:  document text
+    language: an optional ISO 639-2 T language code, which must be 'eng' since
+              the lookup tables are for English
+    uri:      not supported, since the local analyzer can't extract content
+              from a URI
+
+    """
+    if uri:
+        raise ValueError('the local analyzer does not support content URIs')
+    if language not in (None, 'eng'):
+        raise ValueError('the local analyzer only supports English (eng)')
+    sentences = local_sentences(content)
+    tokens = []
+    for sentence in sentences:
+        text = get_text({'data': content}, sentence)
+        sentence_initial = True
+        for match in LOCAL_TOKEN.finditer(text):
+            tokens.append({
+                'startOffset': sentence['startOffset'] + match.start(),
+                'endOffset': sentence['startOffset'] + match.end(),
+                'text': match.group(),
+                'sentenceInitial': sentence_initial
+            })
+            # sentence-initial is the first alphanumeric token, so leading
+            # quotes and brackets are skipped
+            if any(c.isalnum() for c in match.group()):
+                sentence_initial = False
+    # capitalized forms that occur after the start of a sentence are treated as
+    # proper nouns wherever they occur
+    proper_nouns = {
+        t['text'] for t in tokens
+        if t['text'][0].isupper() and not t['sentenceInitial']
+    }
+    for token in tokens:
+        sentence_initial = token.pop('sentenceInitial')
+        token['analyses'] = [
+            local_analysis(token['text'], sentence_initial, proper_nouns)
+        ]
+    # lemmas that occur as verbs are tagged as verbs wherever they occur so that
+    # e.g., "uses", "used", and "using" are counted together
+    verbs = {
+        analysis(t)['lemma'] for t in tokens
+        if analysis(t)['partOfSpeech'] == 'VERB'
+    }
+    for token in tokens:
+        if analysis(token)['partOfSpeech'] == 'NOUN' and analysis(token)['lemma'] in verbs:
+            analysis(token)['partOfSpeech'] = 'VERB'
+    return {
+        'version': '1.1.0',
+        'data': content,
+        'attributes': {
+            'sentence': {'type': 'list', 'itemType': 'sentence', 'items': sentences},
+            'token': {'type': 'list', 'itemType': 'token', 'items': tokens},
+            'entities': {'type': 'list', 'itemType': 'entities', 'items': []}
+        }
+    }
+
 def analysis(token):
     """Get the first analysis of a token
     
@@ -508,10 +973,11 @@ def get_text(adm, obj):
     return adm['data'][slice(*extent(obj))]
 
 def score_sentences(adm):
-    """Assign a score and token-length to each sentence in an ADM
+    """Assign a score, token-length, and entities to each sentence in an ADM
     
-    A higher scores indicates a sentence that is more contentful.  The ADM is 
-    modified in-place.
+    A higher scores indicates a sentence that is more contentful.  The entities
+    are the identifiers of the entities whose mentions contributed to the 
+    score.  The ADM is modified in-place.
     
     adm["attributes"]["sentence"]["items"][0].keys() -> [
         "startOffset",
@@ -522,7 +988,8 @@ def score_sentences(adm):
         "startOffset",
         "endOffset",
         "score",
-        "tokenLength"
+        "tokenLength",
+        "entities"
     ]
     
     """
@@ -531,11 +998,19 @@ def score_sentences(adm):
     sentences = adm['attributes']['sentence']['items']
     tokens = sorted(adm['attributes']['token']['items'], key=extent)
     mentions = sorted(entity_mentions(adm), key=extent)
+    # the token and mention following each sentence are carried over to the
+    # next sentence
+    token = tokens.pop(0) if tokens else {}
+    mention = mentions.pop(0) if mentions else {}
     for i, sentence in enumerate(sentences):
         sentence['score'] = 0.0
         sentence['tokenLength'] = 0
-        token = tokens.pop(0) if tokens else {}
-        mention = mentions.pop(0) if mentions else {}
+        sentence['entities'] = []
+        # skip anything that ends before the sentence starts
+        while token and extent(token)[1] <= extent(sentence)[0]:
+            token = tokens.pop(0) if tokens else {}
+        while mention and extent(mention)[1] <= extent(sentence)[0]:
+            mention = mentions.pop(0) if mentions else {}
         # frequencies of contentful tokens inscrease the sentence the score
         while overlaps(token, sentence):
             sentence['score'] += score(token, lemma_frequencies, token_key)
@@ -543,7 +1018,10 @@ def score_sentences(adm):
             sentence['tokenLength'] += 1
         # frequencies of contentful entity mentions contribute to the score
         while overlaps(mention, sentence):
-            sentence['score'] += score(mention, entity_frequencies, entity_key)
+            mention_score = score(mention, entity_frequencies, entity_key)
+            if mention_score and entity_key(mention) not in sentence['entities']:
+                sentence['entities'].append(entity_key(mention))
+            sentence['score'] += mention_score
             mention = mentions.pop(0) if mentions else {}
         # normalize sentence score by sentence length
         sentence['score'] /= max(sentence['tokenLength'], 1)
@@ -609,6 +1087,161 @@ def summarize(adm, summarize_percent, n=None):
         'summary': summary
     }
 
+STORE_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sentence (
+    docId TEXT NOT NULL,
+    startOffset INTEGER NOT NULL,
+    endOffset INTEGER NOT NULL,
+    score REAL NOT NULL,
+    tokenLength INTEGER NOT NULL,
+    PRIMARY KEY (docId, startOffset, endOffset)
+);
+CREATE INDEX IF NOT EXISTS sentence_doc_score ON sentence (docId, score DESC);
+CREATE TABLE IF NOT EXISTS sentence_entity (
+    entityId TEXT NOT NULL,
+    docId TEXT NOT NULL,
+    startOffset INTEGER NOT NULL,
+    endOffset INTEGER NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (entityId, docId, startOffset, endOffset)
+);
+CREATE INDEX IF NOT EXISTS sentence_entity_score ON sentence_entity (entityId, score DESC);
+CREATE INDEX IF NOT EXISTS sentence_entity_doc ON sentence_entity (docId, entityId, score DESC);
+'''
+
+def open_store(path):
+    """Open (creating if necessary) an SQLite store of sentence scores
+    
+    The store has a sentence table keyed by document identifier and sentence
+    offsets, and a sentence_entity table that repeats each sentence's score for
+    every entity that contributed to it.  Both tables are indexed by score so
+    that top_sentences and top_entity_sentences don't have to scan the store.
+    
+    path: path to the SQLite database file (or ':memory:')
+    
+    """
+    store = sqlite3.connect(path)
+    store.row_factory = sqlite3.Row
+    store.executescript(STORE_SCHEMA)
+    return store
+
+def store_sentences(store, adms):
+    """Write scored sentences of one or more ADMs to a store
+    
+    All of the ADMs are written in a single transaction.  Sentences previously
+    stored for the same document identifier are replaced.
+    
+    Every entity that contributed to a sentence is written to sentence_entity,
+    including unlinked entities.  Rosette API gives unlinked entities 
+    identifiers such as 'T0' or 'T1' that are only unique within a document, so
+    top_entity_sentences only looks them up within a single document.
+    
+    store: an SQLite connection from open_store
+    adms:  an iterable of (doc_id, adm) pairs where each ADM has been scored
+           by score_sentences (or summarize)
+    
+    """
+    with store:
+        for doc_id, adm in adms:
+            sentences = adm['attributes']['sentence']['items']
+            store.execute('DELETE FROM sentence WHERE docId = ?', (doc_id,))
+            store.execute('DELETE FROM sentence_entity WHERE docId = ?', (doc_id,))
+            store.executemany(
+                'INSERT INTO sentence VALUES (?, ?, ?, ?, ?)',
+                (
+                    (doc_id, *extent(s), s['score'], s['tokenLength'])
+                    for s in sentences
+                )
+            )
+            store.executemany(
+                'INSERT INTO sentence_entity VALUES (?, ?, ?, ?, ?)',
+                (
+                    (entity_id, doc_id, *extent(s), s['score'])
+                    for s in sentences
+                    for entity_id in s.get('entities', [])
+                    if entity_id
+                )
+            )
+
+def top_sentences(store, doc_id, k=10):
+    """Get the k highest scoring sentences stored for a document
+    
+    Each sentence includes the identifiers of the entities that contributed to
+    its score.
+    
+    top_sentences(store, 'saturn.txt', 1) -> [
+        {
+            'docId': 'saturn.txt',
+            'startOffset': 0,
+            'endOffset': 45,
+            'score': 29.100689277811085,
+            'tokenLength': 9,
+            'entities': ['Q193']
+        }
+    ]
+    
+    """
+    rows = store.execute(
+        'SELECT * FROM sentence WHERE docId = ? ORDER BY score DESC LIMIT ?',
+        (doc_id, k)
+    )
+    sentences = [dict(row, entities=[]) for row in rows]
+    by_extent = {extent(sentence): sentence for sentence in sentences}
+    rows = store.execute(
+        'SELECT * FROM sentence_entity WHERE docId = ? ORDER BY rowid',
+        (doc_id,)
+    )
+    for row in map(dict, rows):
+        if extent(row) in by_extent:
+            by_extent[extent(row)]['entities'].append(row['entityId'])
+    return sentences
+
+def top_entity_sentences(store, entity_id, k=10, doc_id=None):
+    """Get the k highest scoring sentences for an entity
+    
+    Sentences are drawn from every document unless doc_id is specified.  Only 
+    entities linked to Wikidata (identifiers starting with 'Q') can be looked
+    up across documents, since identifiers of unlinked entities (e.g., 'T1')
+    are only unique within a document, so doc_id is required for those.
+    
+    adm['data'] -> 'It rained. The U.S. grew. The U.S. won.'
+    store_sentences(store, [('us.txt', adm)])
+    top_entity_sentences(store, 'Q30') -> [
+        {
+            'entityId': 'Q30',
+            'docId': 'us.txt',
+            'startOffset': 11,
+            'endOffset': 26,
+            'score': 1.6479184330021646
+        },
+        {
+            'entityId': 'Q30',
+            'docId': 'us.txt',
+            'startOffset': 26,
+            'endOffset': 39,
+            'score': 0.8664339756999316
+        }
+    ]
+    
+    """
+    if doc_id is not None:
+        rows = store.execute(
+            'SELECT * FROM sentence_entity WHERE entityId = ? AND docId = ? '
+            'ORDER BY score DESC LIMIT ?',
+            (entity_id, doc_id, k)
+        )
+    elif entity_id.startswith('Q'):
+        rows = store.execute(
+            'SELECT * FROM sentence_entity WHERE entityId = ? '
+            'ORDER BY score DESC LIMIT ?',
+            (entity_id, k)
+        )
+    else:
+        raise ValueError(
+            'unlinked entity {} can only be looked up with a doc_id'.format(entity_id)
+        )
+    return [dict(row) for row in rows]
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -626,6 +1259,12 @@ if __name__ == '__main__':
         action='store_true',
         help='Specify that the input is a URI (otherwise load text from file)'
     )
+    parser.add_argument(
+        '-o',
+        '--offline',
+        action='store_true',
+        help='Analyze the input with the local, rule-based analyzer instead of Rosette API (faster but less accurate; no entity extraction)'
+    )
     parser.add_argument(
         '-k',
         '--key',
@@ -664,17 +1303,42 @@ if __name__ == '__main__':
         help='Get the full ADM with summarization info as JSON',
         action='store_true'
     )
+    parser.add_argument(
+        '-s',
+        '--store',
+        help='Path to an SQLite file in which to store the sentence scores',
+        default=None
+    )
+    parser.add_argument(
+        '-d',
+        '--doc-id',
+        help='Document identifier for stored sentence scores (defaults to the input path or URI)',
+        default=None
+    )
     args = parser.parse_args()
-    # Get the user's Rosette API key
-    key = args.key or getpass(prompt='Enter your Rosette API key: ')
-    # Instantiate the Rosette API
-    api = API(user_key=key, service_url=args.api_url)
+    if args.offline and args.content_uri:
+        parser.error('-o/--offline cannot be used with -u/--content-uri')
+    if args.offline and args.language not in (None, 'eng'):
+        parser.error('-o/--offline only supports English (-l eng)')
     # Load content from file path, URI, or stdin
     content = get_content(args.input, args.content_uri)
-    # Get the ADM result
-    adm = get_adm(content, api, args.language, args.content_uri)
+    if args.offline:
+        # Get the ADM result from the local analyzer
+        adm = get_local_adm(content, args.language)
+    else:
+        # Get the user's Rosette API key
+        key = args.key or getpass(prompt='Enter your Rosette API key: ')
+        # Instantiate the Rosette API
+        api = API(user_key=key, service_url=args.api_url)
+        # Get the ADM result
+        adm = get_adm(content, api, args.language, args.content_uri)
     # Perform summarization on the ADM
     summarize(adm, args.percent, args.top_n)
+    if args.store:
+        # Persist the sentence scores
+        store = open_store(args.store)
+        store_sentences(store, [(args.doc_id or args.input or '-', adm)])
+        store.close()
     if args.verbose:
         print(json.dumps(adm, ensure_ascii=False))
     else: